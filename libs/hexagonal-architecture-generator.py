@@ -6,32 +6,230 @@ Generates a complete Java Spring Boot project following Hexagonal Architecture (
 from Mustache templates and configuration.
 """
 
+import argparse
+import hashlib
 import json
+import logging
+import mmap
+import multiprocessing
 import os
+import re
+import shlex
+import shutil
+import subprocess
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import Dict, Any, List
 import pystache
-import subprocess
-import glob
+
+# Prefer a C JSON parser when one is installed; all of them accept the raw file bytes
+try:
+    from orjson import loads as _json_loads
+    _JSON_LOADS_BUFFERS = True
+except ImportError:
+    _JSON_LOADS_BUFFERS = False
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+# Files at least this large are parsed straight from a memory map when the parser allows it
+_MMAP_MIN_SIZE = 64 * 1024
+
+def _load_json_file(file_path: str) -> Any:
+    """
+    Parse a JSON file, avoiding a copy of large files into a bytes object.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    with open(file_path, 'rb') as f:
+        if _JSON_LOADS_BUFFERS and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return _json_loads(view)
+        return _json_loads(f.read())
+
+logger = logging.getLogger("codegen")
+
+# HTML entities that can survive rendering, undone in a single pass
+_HTML_ENTITY_RE = re.compile(r'&(quot|lt|gt|amp);')
+_HTML_ENTITIES = {'quot': '"', 'lt': '<', 'gt': '>', 'amp': '&'}
+
+# Email properties get a canonical pattern, escaped for a Java string literal
+_EMAIL_NAME_RE = re.compile('email', re.IGNORECASE)
+_EMAIL_PATTERN = r'^[^@]+@[^@]+\.[^@]+$'
+_JAVA_EMAIL_PATTERN = r'^[^@]+@[^@]+\\.[^@]+$'
+
+# Types that use case ports take or return directly instead of a generated DTO
+_JAVA_NATIVE_TYPES = frozenset(('String', 'Integer', 'Long', 'Boolean', 'Double', 'Float', 'Object', 'Void'))
+
+# Entities whose name identifies the service of an operation, in priority order
+_KNOWN_SERVICE_ENTITIES = ('User', 'Movie', 'Location')
+
+# Lookup operations on these resources belong to the Location entity
+_LOCATION_RELATED_RESOURCES = ('Cities', 'Countries', 'Regions', 'Neighborhoods')
+
+# Basic CRUD operation ids: Create/Get/Update/Delete{Entity} and List{Entity}s
+_CRUD_OPERATION_RE = re.compile(r'(Create|Get|Update|Delete|List)(.+)')
+
+# Template flags for each supported database; msserver is an alias for sqlserver
+_DATABASE_TYPES = ('postgresql', 'mysql', 'oracle', 'sqlserver', 'h2')
+_DATABASE_FLAGS = {db_type: {flag: flag == db_type for flag in _DATABASE_TYPES} for db_type in _DATABASE_TYPES}
+_DATABASE_FLAGS['msserver'] = _DATABASE_FLAGS['sqlserver']
+_UNKNOWN_DATABASE_FLAGS = dict.fromkeys(_DATABASE_TYPES, False)
+
+# Parsed templates by path, shared by every generator in the process; filled before
+# forking workers so they inherit the parsed templates instead of parsing their own
+_PARSED_TEMPLATES: Dict[Path, pystache.parsed.ParsedTemplate] = {}
+
+def load_template(template_path: Path) -> pystache.parsed.ParsedTemplate:
+    """
+    Read and parse a Mustache template, reusing an earlier parse of the same file.
+
+    Args:
+        template_path: Path to the template file
+
+    Returns:
+        Parsed template, ready to pass to pystache.Renderer.render()
+
+    Raises:
+        FileNotFoundError: If template file doesn't exist
+    """
+    parsed = _PARSED_TEMPLATES.get(template_path)
+    if parsed is None:
+        try:
+            with open(template_path, 'r') as f:
+                source = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
+        parsed = _PARSED_TEMPLATES[template_path] = pystache.parse(source)
+    return parsed
+
+def _template_stats(templates_dir: Path) -> List[tuple]:
+    """
+    List the name, size and mtime of every Mustache template in a directory.
+
+    Args:
+        templates_dir: Directory containing Mustache templates
+
+    Returns:
+        Sorted list of (name, size, mtime_ns) tuples; empty if the directory doesn't exist
+    """
+    try:
+        with os.scandir(templates_dir) as entries:
+            return sorted(
+                (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                for entry in entries if entry.name.endswith('.mustache') and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
+# Smithy build configuration, read by `smithy build` from the working directory
+_SMITHY_CONFIG = Path("smithy-build.json")
+
+def smithy_output_dir(smithy_config: Path = _SMITHY_CONFIG) -> Path:
+    """
+    Find the directory `smithy build` writes its projections to.
+
+    Args:
+        smithy_config: Path to smithy-build.json
+
+    Returns:
+        The configured outputDirectory, relative to the config file, or Smithy's
+        default build/smithy next to it
+    """
+    try:
+        with open(smithy_config, 'rb') as f:
+            output_dir = _json_loads(f.read()).get('outputDirectory')
+    except FileNotFoundError:
+        output_dir = None
+    return smithy_config.parent / (output_dir or "build/smithy")
+
+def preload_templates(templates_dir: str):
+    """
+    Parse every Mustache template in a directory into the shared template cache.
+
+    Args:
+        templates_dir: Directory containing Mustache templates
+    """
+    templates_dir = Path(templates_dir)
+    if not templates_dir.is_dir():
+        return
+    for name, _, _ in _template_stats(templates_dir):
+        load_template(templates_dir / name)
 
 class HexagonalArchitectureGenerator:
-    def __init__(self, config_path: str, templates_dir: str, project_config: Dict[str, Any]):
+    # Fixed attribute layout; per-project state is (re)bound in set_project()
+    __slots__ = (
+        'config_path', 'templates_dir', 'smithy_output_dir', '_created_dirs',
+        '_write_pool', '_pending_writes', '_renderer',
+        'project_config', 'output_dir', 'base_package', 'openapi_specs',
+        'spec_schemas', 'spec_operations', 'operation_services', 'generated_files',
+        '_written_digests', '_path_writes', '_schema_vars_cache', '_dto_dir_cache', '_dto_import_prefix',
+        '_complex_op_info', 'target_packages', '_package_paths', 'mustache_context',
+    )
+    
+    def __init__(self, config_path: str, templates_dir: str, project_config: Dict[str, Any] = None):
         """
         Initialize the Hexagonal Architecture Generator.
         
         Args:
             config_path: Path to the configuration JSON file
             templates_dir: Directory containing Mustache templates
-            project_config: Single project configuration from the array
+            project_config: Optional single project configuration from the array;
+                can also be bound later with set_project()
         """
         self.config_path = config_path
         self.templates_dir = Path(templates_dir)
+        self.smithy_output_dir = smithy_output_dir()
+        self._created_dirs: set = set()
+        # Files are written in the background while the next template renders
+        self._write_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="codegen-write")
+        self._pending_writes = []
+        # Render with HTML escaping disabled to prevent &lt; &gt; encoding
+        self._renderer = pystache.Renderer(escape=lambda u: u)
+        if project_config is not None:
+            self.set_project(project_config)
+    
+    def set_project(self, project_config: Dict[str, Any]):
+        """
+        Bind the generator to a project configuration.
+
+        Only per-project state is replaced, so one generator can be reused for
+        every project in the configuration array.
+
+        Args:
+            project_config: Single project configuration from the array
+        """
         self.project_config = project_config
         self.output_dir = Path("projects") / project_config['project']['general']['name']
         self.base_package = project_config['project']['params']['configOptions']['basePackage']
         self.openapi_specs = self._load_openapi_specs()
+        self.spec_schemas, self.spec_operations, self.operation_services = self._index_specs()
+        self.generated_files: List[Path] = []
+        # Writes queued for this project only; generate_complete_project drains or discards them
+        self._pending_writes = []
+        # Digest of the content last written to each path, to skip repeated writes
+        self._written_digests: Dict[Path, bytes] = {}
+        # Last write queued for each path, so writes to one path land in order
+        self._path_writes: Dict[Path, Future] = {}
+        # Keyed by id() of schemas in openapi_specs, so only valid for this project
+        self._schema_vars_cache: Dict[int, tuple] = {}
+        # File names per DTO directory, listed once and kept current by _write_file
+        self._dto_dir_cache: Dict[Path, set] = {}
+        # "<application_dto package>.<service>." per service, see _get_dto_import_prefix
+        self._dto_import_prefix: Dict[str, str] = {}
+        # Template entries for complex operations, shared by use case, service and controller
+        self._complex_op_info: Dict[str, Dict[str, str]] = {}
         self.target_packages = self._define_target_packages()
+        # Output directory of every target package, joined once instead of per generated file
+        self._package_paths = {key: self.output_dir / self._get_package_path(package)
+                               for key, package in self.target_packages.items()}
         self.mustache_context = self._build_mustache_context()
         
     @staticmethod
@@ -44,10 +242,9 @@ class HexagonalArchitectureGenerator:
             
         Raises:
             FileNotFoundError: If configuration file doesn't exist
-            json.JSONDecodeError: If configuration file is invalid JSON
+            ValueError: If configuration file is invalid JSON
         """
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _load_json_file(config_path)
     
     def _load_openapi_specs(self) -> List[Dict[str, Any]]:
         """
@@ -60,10 +257,28 @@ class HexagonalArchitectureGenerator:
             FileNotFoundError: If no OpenAPI spec files are found
         """
         project_folder = self.project_config['project']['general']['folder']
-        openapi_files = glob.glob(f"build/smithy/{project_folder}/openapi/*.openapi.json")
-        
-        # Also check for additional projections (e.g., back-ms-users-location)
-        additional_projections = glob.glob(f"build/smithy/{project_folder}-*/openapi/*.openapi.json")
+        openapi_files = []
+        
+        # Also check for additional projections (e.g., back-ms-users-location);
+        # one pass over the build directory finds both, main projection first
+        additional_projections = []
+        try:
+            with os.scandir(self.smithy_output_dir) as projections:
+                for projection in projections:
+                    if projection.name == project_folder:
+                        target = openapi_files
+                    elif projection.name.startswith(f"{project_folder}-"):
+                        target = additional_projections
+                    else:
+                        continue
+                    try:
+                        with os.scandir(os.path.join(projection.path, "openapi")) as entries:
+                            target.extend(entry.path for entry in entries
+                                          if entry.name.endswith(".openapi.json") and not entry.name.startswith("."))
+                    except (FileNotFoundError, NotADirectoryError):
+                        pass
+        except FileNotFoundError:
+            pass
         openapi_files.extend(additional_projections)
         
         if not openapi_files:
@@ -71,17 +286,47 @@ class HexagonalArchitectureGenerator:
         
         specs = []
         for file_path in openapi_files:
-            with open(file_path, 'r') as f:
-                spec_data = json.load(f)
-                service_name = self._extract_service_name_from_path(file_path)
-                specs.append({
-                    'spec': spec_data,
-                    'file_path': file_path,
-                    'service_name': service_name
-                })
+            spec_data = _load_json_file(file_path)
+            service_name = self._extract_service_name_from_path(file_path)
+            specs.append({
+                'spec': spec_data,
+                'file_path': file_path,
+                'service_name': service_name
+            })
         
         return specs
     
+    def _index_specs(self) -> tuple:
+        """
+        Flatten the loaded OpenAPI specs into the views used during generation.
+
+        Specs are walked once here, so later passes iterate flat data instead of
+        nesting over specs, paths and methods again.
+
+        Returns:
+            Tuple of (schemas, operations, operation_services): schemas keyed by
+            "<service>_<schema>" with data, service and original_name; operations as
+            a list of {'id', 'service'} in spec order; and operationId to service name,
+            where the first spec wins on duplicates
+        """
+        schemas = {}
+        operations = []
+        operation_services = {}
+        for spec_info in self.openapi_specs:
+            service_name = spec_info['service_name']
+            for schema_name, schema_data in spec_info['spec'].get('components', {}).get('schemas', {}).items():
+                schemas[f"{service_name}_{schema_name}"] = {
+                    'data': schema_data,
+                    'service': service_name,
+                    'original_name': schema_name
+                }
+            for path_data in spec_info['spec'].get('paths', {}).values():
+                for method_data in path_data.values():
+                    if isinstance(method_data, dict) and 'operationId' in method_data:
+                        operations.append({'id': method_data['operationId'], 'service': service_name})
+                        operation_services.setdefault(method_data['operationId'], service_name)
+        return schemas, operations, operation_services
+    
     def _extract_service_name_from_path(self, file_path: str) -> str:
         """
         Extract service name from OpenAPI file path.
@@ -142,39 +387,28 @@ class HexagonalArchitectureGenerator:
         Returns:
             Dictionary containing all template variables and configuration
         """
-        context = self.project_config.copy()
-        context.update(self.project_config['project']['params']['configOptions'])
-        context.update(self.target_packages)
-        
-        # Add project parameters from project config
-        if 'project' in self.project_config:
-            context['author'] = self.project_config['project']['general'].get('author', 'Generator')
-            context['version'] = self.project_config['project']['general'].get('version', '1.0.0')
-            context['artifactVersion'] = self.project_config['project']['params'].get('artifactVersion', '1.0.0')
-            context['project'] = self.project_config['project']['general']
-            context.update(self.project_config['project']['params'])
-        
-        # Add infrastructure configuration
-        if 'infra' in self.project_config:
-            context['infra'] = self.project_config['infra']
+        project = self.project_config['project']
+        general = project['general']
+        params = project['params']
         
         # Set database type flags for conditional rendering - default to H2 if empty
-        db_config = self.project_config.get('database', {})
-        db_type = db_config.get('sgbd', 'h2').lower() if db_config else 'h2'
-        context.update({
-            'database': {
-                **db_config,
-                'postgresql': db_type == 'postgresql',
-                'mysql': db_type == 'mysql', 
-                'oracle': db_type == 'oracle',
-                'sqlserver': db_type == 'sqlserver' or db_type == 'msserver',
-                'h2': not db_type or db_type == 'h2'  # Default to H2 if empty
-            },
+        db_config = self.project_config.get('database') or {}
+        db_type = (db_config.get('sgbd') or 'h2').lower()
+        
+        # Later entries win, so project params override the general defaults
+        return {
+            **self.project_config,
+            **params['configOptions'],
+            **self.target_packages,
+            'author': general.get('author', 'Generator'),
+            'version': general.get('version', '1.0.0'),
+            'artifactVersion': params.get('artifactVersion', '1.0.0'),
+            'project': general,
+            **params,
+            'database': {**db_config, **_DATABASE_FLAGS.get(db_type, _UNKNOWN_DATABASE_FLAGS)},
             'smithyModel': 'user-service.smithy',
             'generatorVersion': '1.0.0'
-        })
-        
-        return context
+        }
     
     def _get_package_path(self, package_name: str) -> Path:
         """
@@ -192,18 +426,29 @@ class HexagonalArchitectureGenerator:
         """
         Create directory if it doesn't exist.
 
+        Directories already created by this generator, and their parents, are
+        remembered, so the many files written into the same package only pay for one mkdir.
+
         Args:
             path: Path object representing the directory to create
         """
+        if path in self._created_dirs:
+            return
         path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(path)
+        self._created_dirs.update(path.parents)
     
-    def _render_template(self, template_name: str, context: Dict[str, Any]) -> str:
+    def _render_template(self, template_name: str, context: Dict[str, Any] = None) -> str:
         """
         Render Mustache template with given context.
 
+        Templates are read and parsed once per process (see load_template) and reused for every render.
+        The project-wide Mustache context is layered underneath the given context, so
+        callers only pass the variables they add or override.
+
         Args:
             template_name: Name of the template file
-            context: Dictionary containing template variables
+            context: Optional dictionary containing template-specific variables
             
         Returns:
             Rendered template content as string
@@ -211,37 +456,80 @@ class HexagonalArchitectureGenerator:
         Raises:
             FileNotFoundError: If template file doesn't exist
         """
-        template_path = self.templates_dir / template_name
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(template_path, 'r') as f:
-            template_content = f.read()
+        parsed = load_template(self.templates_dir / template_name)
         
-        # Render with HTML escaping disabled to prevent &lt; &gt; encoding
-        renderer = pystache.Renderer(escape=lambda u: u)
-        rendered = renderer.render(template_content, context)
+        if context:
+            rendered = self._renderer.render(parsed, self.mustache_context, context)
+        else:
+            rendered = self._renderer.render(parsed, self.mustache_context)
         
         # Fix HTML entities that might still appear
-        rendered = rendered.replace('&quot;', '"')
-        rendered = rendered.replace('&lt;', '<')
-        rendered = rendered.replace('&gt;', '>')
-        rendered = rendered.replace('&amp;', '&')
+        if '&' in rendered:
+            rendered = _HTML_ENTITY_RE.sub(lambda m: _HTML_ENTITIES[m.group(1)], rendered)
         
         return rendered
     
-    def _write_file(self, file_path: Path, content: str):
+    def _write_file(self, file_path: Path, content: str, mode: int = None):
         """
         Write content to file, creating directories as needed.
 
+        Directories are created right away, but the write itself is queued on a
+        background thread; call _wait_for_writes() before reading generated files back.
+        The path is recorded in generated_files and reported once the project is
+        complete, instead of logging every file as it is written. Repeating a write
+        with unchanged content is a no-op; a write with new content waits for the
+        earlier write to the same path, so the last content generated is what ends up
+        on disk.
+
         Args:
             file_path: Path where the file will be written
             content: String content to write to the file
+            mode: Optional permission bits to apply after writing (e.g. 0o755)
         """
+        data = content.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        # The same file requested twice with the same content is written once
+        if self._written_digests.get(file_path) == digest:
+            return
+        first_write = file_path not in self._written_digests
+        self._written_digests[file_path] = digest
+        
         self._ensure_directory(file_path.parent)
-        with open(file_path, 'w') as f:
-            f.write(content)
-        print(f"Generated: {file_path}")
+        previous_write = self._path_writes.get(file_path)
+        if previous_write is not None:
+            previous_write.result()
+        future = self._path_writes[file_path] = self._write_pool.submit(self._write_file_contents, file_path, data, mode)
+        self._pending_writes.append(future)
+        if first_write:
+            self.generated_files.append(file_path)
+        listed_names = self._dto_dir_cache.get(file_path.parent)
+        if listed_names is not None:
+            listed_names.add(file_path.name)
+    
+    @staticmethod
+    def _write_file_contents(file_path: Path, data: bytes, mode: int = None):
+        """
+        Write encoded content to a file and optionally set its permissions.
+
+        Args:
+            file_path: Path where the file will be written
+            data: Encoded file content
+            mode: Optional permission bits to apply after writing
+        """
+        file_path.write_bytes(data)
+        if mode is not None:
+            os.chmod(file_path, mode)
+    
+    def _wait_for_writes(self):
+        """
+        Block until every queued file write has finished.
+
+        Raises:
+            OSError: If any of the queued writes failed
+        """
+        pending_writes, self._pending_writes = self._pending_writes, []
+        for future in pending_writes:
+            future.result()
     
     def _convert_openapi_property(self, prop_name: str, prop_data: Dict[str, Any], required_fields: List[str]) -> Dict[str, Any]:
         """
@@ -255,6 +543,7 @@ class HexagonalArchitectureGenerator:
         Returns:
             Dictionary containing Java property information
         """
+        is_required = prop_name in required_fields
         prop_type = prop_data.get('type', 'string')
         prop_format = prop_data.get('format')
         
@@ -295,7 +584,7 @@ class HexagonalArchitectureGenerator:
         
         # Build validation annotations
         validation_annotations = []
-        if prop_name in required_fields:
+        if is_required:
             validation_annotations.append('@NotNull')
         
         if 'minLength' in prop_data:
@@ -309,38 +598,77 @@ class HexagonalArchitectureGenerator:
         if 'pattern' in prop_data:
             # Use correct email pattern for validation
             pattern = prop_data['pattern']
-            if 'email' in prop_name.lower() or pattern == '^[^@]+@[^@]+\.[^@]+$':
-                pattern = '^[^@]+@[^@]+\\\\.[^@]+$'
+            if _EMAIL_NAME_RE.search(prop_name) or pattern == _EMAIL_PATTERN:
+                pattern = _JAVA_EMAIL_PATTERN
             validation_annotations.append(f'@Pattern(regexp = "{pattern}")')
         
+        capitalized_name = prop_name.capitalize()
         return {
             'name': prop_name,
             'dataType': java_type,
             'datatypeWithEnum': java_type,
             'baseName': prop_name,
-            'getter': f'get{prop_name.capitalize()}',
-            'setter': f'set{prop_name.capitalize()}',
+            'getter': 'get' + capitalized_name,
+            'setter': 'set' + capitalized_name,
             'jsonProperty': prop_name,
-            'required': prop_name in required_fields,
+            'required': is_required,
             'hasValidation': len(validation_annotations) > 0,
             'validationAnnotations': validation_annotations,
             'import': import_type
         }
     
+    def _build_vars_and_imports(self, schema_data: Dict[str, Any]) -> tuple:
+        """
+        Convert all properties of an OpenAPI schema to Java properties.
+
+        The result is cached per schema, since the same schema is rendered as a DTO,
+        a domain model and an entity. Callers must not modify the returned lists or
+        the dictionaries in them; copy a property before changing it.
+
+        Args:
+            schema_data: OpenAPI schema definition
+
+        Returns:
+            Tuple of (list of Java property dictionaries, Java import block)
+        """
+        cached = self._schema_vars_cache.get(id(schema_data))
+        if cached is None:
+            required_fields = schema_data.get('required', [])
+            vars_list = [self._convert_openapi_property(prop_name, prop_data, required_fields)
+                         for prop_name, prop_data in schema_data.get('properties', {}).items()]
+            import_block = self._build_import_block(var_info['import'] for var_info in vars_list)
+            cached = self._schema_vars_cache[id(schema_data)] = (vars_list, import_block)
+        return cached
+    
+    @staticmethod
+    def _build_import_block(imports) -> str:
+        """
+        Render Java import statements, one per line, sorted and without duplicates.
+
+        Templates insert the block on a line of its own inside an {{#importBlock}}
+        section, so an empty block leaves no blank line behind.
+
+        Args:
+            imports: Iterable of fully qualified class names; empty values are skipped
+            
+        Returns:
+            Import statements separated by newlines, without a trailing newline
+        """
+        return '\n'.join(f"import {imp};" for imp in sorted({imp for imp in imports if imp}))
+    
     def generate_entity_status_enum(self):
         """
         Generate EntityStatus enum for domain layer.
 
         Creates an enum class representing entity status values.
         """
-        context = self.mustache_context.copy()
-        context.update({
+        context = {
             'packageName': self.target_packages['domain_model'],
             'classname': 'EntityStatus'
-        })
+        }
         
         content = self._render_template('EntityStatus.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['domain_model']) / "EntityStatus.java"
+        file_path = self._package_paths['domain_model'] / "EntityStatus.java"
         self._write_file(file_path, content)
     
     def generate_domain_model(self, entity_name: str, schema_data: Dict[str, Any]):
@@ -351,37 +679,23 @@ class HexagonalArchitectureGenerator:
             entity_name: Name of the entity (e.g., 'User')
             schema_data: OpenAPI schema definition for the entity
         """
-        context = self.mustache_context.copy()
-        
         # Extract properties and build vars (without validation annotations for domain)
-        properties = schema_data.get('properties', {})
-        required_fields = schema_data.get('required', [])
-        
-        vars_list = []
-        imports = set()
+        schema_vars, import_block = self._build_vars_and_imports(schema_data)
+        vars_list = [{**var_info, 'hasValidation': False, 'validationAnnotations': []} for var_info in schema_vars]
         
-        for prop_name, prop_data in properties.items():
-            var_info = self._convert_openapi_property(prop_name, prop_data, required_fields)
-            # Remove validation annotations for domain model
-            var_info['hasValidation'] = False
-            var_info['validationAnnotations'] = []
-            vars_list.append(var_info)
-            if var_info.get('import'):
-                imports.add(var_info['import'])
-        
-        context.update({
+        context = {
             'packageName': self.target_packages['domain_model'],
             'classname': entity_name,
             'vars': vars_list,
-            'imports': [{'import': imp} for imp in sorted(imports)],
+            'importBlock': import_block,
             'models': [{'model': {'classname': entity_name, 'vars': vars_list}}],
             'isDomainModel': True,
             'useJPA': False,
             'useLombok': True
-        })
+        }
         
         content = self._render_template('pojo.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['domain_model']) / f"{entity_name}.java"
+        file_path = self._package_paths['domain_model'] / f"{entity_name}.java"
         self._write_file(file_path, content)
     
     def generate_dto(self, schema_name: str, schema_data: Dict[str, Any], service_name: str):
@@ -393,36 +707,24 @@ class HexagonalArchitectureGenerator:
             schema_data: OpenAPI schema definition
             service_name: Service name for DTO organization
         """
-        context = self.mustache_context.copy()
-        
         # Extract properties and build vars
-        properties = schema_data.get('properties', {})
-        required_fields = schema_data.get('required', [])
-        
-        vars_list = []
-        imports = set()
-        
-        for prop_name, prop_data in properties.items():
-            var_info = self._convert_openapi_property(prop_name, prop_data, required_fields)
-            vars_list.append(var_info)
-            if var_info.get('import'):
-                imports.add(var_info['import'])
+        vars_list, import_block = self._build_vars_and_imports(schema_data)
         
         # Create service-specific DTO package
         dto_package = f"{self.target_packages['application_dto']}.{service_name}"
         
-        context.update({
+        context = {
             'packageName': dto_package,
             'classname': schema_name,
             'vars': vars_list,
-            'imports': [{'import': imp} for imp in sorted(imports)],
+            'importBlock': import_block,
             'models': [{'model': {'classname': schema_name, 'vars': vars_list}}],
             'useBeanValidation': True,
             'useJackson': True
-        })
+        }
         
         content = self._render_template('pojo.mustache', context)
-        file_path = self.output_dir / self._get_package_path(dto_package) / f"{schema_name}.java"
+        file_path = self._package_paths['application_dto'] / service_name / f"{schema_name}.java"
         self._write_file(file_path, content)
     
     def generate_entity(self, entity_name: str, schema_data: Dict[str, Any] = None):
@@ -433,44 +735,43 @@ class HexagonalArchitectureGenerator:
             entity_name: Name of the entity
             schema_data: Optional OpenAPI schema definition
         """
-        context = self.mustache_context.copy()
+        context = {}
         
         if schema_data:
             # Extract properties and build vars with JPA annotations
-            properties = schema_data.get('properties', {})
-            required_fields = schema_data.get('required', [])
-            
-            vars_list = []
-            imports = set()
+            schema_vars, _ = self._build_vars_and_imports(schema_data)
             
-            for prop_name, prop_data in properties.items():
-                if prop_name not in ['createdAt', 'updatedAt', 'status'] and not prop_name.endswith('Id'):  # Skip timestamp, status and ID fields
-                    var_info = self._convert_openapi_property(prop_name, prop_data, required_fields)
-                    var_info['isIdField'] = prop_name.endswith('Id')
-                    var_info['isTimestampField'] = prop_name in ['createdAt', 'updatedAt']
-                    var_info['isStatusField'] = prop_name == 'status'
-                    vars_list.append(var_info)
-                    if var_info.get('import'):
-                        imports.add(var_info['import'])
+            # Skip timestamp, status and ID fields; the template still reads the field flags
+            vars_list = [
+                {
+                    **var_info,
+                    'isIdField': False,
+                    'isTimestampField': False,
+                    'isStatusField': False
+                }
+                for var_info in schema_vars
+                if var_info['name'] not in ('createdAt', 'updatedAt', 'status') and not var_info['name'].endswith('Id')
+            ]
             
             context.update({
                 'vars': vars_list,
-                'imports': [{'import': imp} for imp in sorted(imports)],
+                'importBlock': self._build_import_block(var_info['import'] for var_info in vars_list),
             })
         
+        entity_var_name = entity_name.lower()
         context.update({
             'packageName': self.target_packages['infra_entity'],
             'classname': f"{entity_name}Dbo",
             'entityName': entity_name,
-            'entityVarName': entity_name.lower(),
-            'tableName': entity_name.lower() + 's',
+            'entityVarName': entity_var_name,
+            'tableName': entity_var_name + 's',
             'isEntity': True,
             'useJPA': True,
             'useLombok': True
         })
         
         content = self._render_template('apiEntity.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_entity']) / f"{entity_name}Dbo.java"
+        file_path = self._package_paths['infra_entity'] / f"{entity_name}Dbo.java"
         self._write_file(file_path, content)
     
     def generate_domain_port_output(self, entity_name: str):
@@ -480,18 +781,17 @@ class HexagonalArchitectureGenerator:
         Args:
             entity_name: Name of the entity for which to create the port
         """
-        context = self.mustache_context.copy()
-        context.update({
+        context = {
             'packageName': self.target_packages['domain_ports_output'],
             'classname': f"{entity_name}RepositoryPort",
             'entityName': entity_name,
             'entityVarName': entity_name.lower(),
             'interfaceOnly': True,
             'isDomainPort': True
-        })
+        }
         
         content = self._render_template('interface.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['domain_ports_output']) / f"{entity_name}RepositoryPort.java"
+        file_path = self._package_paths['domain_ports_output'] / f"{entity_name}RepositoryPort.java"
         self._write_file(file_path, content)
     
     def generate_jpa_repository(self, entity_name: str, entity_schema: Dict[str, Any] = None):
@@ -523,8 +823,7 @@ class HexagonalArchitectureGenerator:
         
         search_query = " OR ".join(search_conditions)
         
-        context = self.mustache_context.copy()
-        context.update({
+        context = {
             'packageName': self.target_packages['infra_repository'],
             'classname': f"Jpa{entity_name}Repository",
             'entityName': entity_name,
@@ -533,10 +832,10 @@ class HexagonalArchitectureGenerator:
             'hasSearchFields': len(search_fields) > 0,
             'isJpaRepository': True,
             'isAdapter': False
-        })
+        }
         
         content = self._render_template('apiRepository.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_repository']) / f"Jpa{entity_name}Repository.java"
+        file_path = self._package_paths['infra_repository'] / f"Jpa{entity_name}Repository.java"
         self._write_file(file_path, content)
     
     def generate_repository_adapter(self, entity_name: str):
@@ -546,8 +845,7 @@ class HexagonalArchitectureGenerator:
         Args:
             entity_name: Name of the entity for the adapter
         """
-        context = self.mustache_context.copy()
-        context.update({
+        context = {
             'packageName': self.target_packages['infra_adapter'],
             'classname': f"{entity_name}RepositoryAdapter",
             'entityName': entity_name,
@@ -557,10 +855,10 @@ class HexagonalArchitectureGenerator:
             'jpaRepositoryName': f"Jpa{entity_name}Repository",
             'isJpaRepository': False,
             'isAdapter': True
-        })
+        }
         
         content = self._render_template('apiRepository.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_adapter']) / f"{entity_name}RepositoryAdapter.java"
+        file_path = self._package_paths['infra_adapter'] / f"{entity_name}RepositoryAdapter.java"
         self._write_file(file_path, content)
     
     def generate_use_case_port(self, operation_name: str, service_name: str = None):
@@ -571,8 +869,6 @@ class HexagonalArchitectureGenerator:
             operation_name: Name of the operation (e.g., 'CreateUser')
             service_name: Service name for DTO organization
         """
-        context = self.mustache_context.copy()
-        
         # Determine request/response types based on operation
         request_type = f"{operation_name}RequestContent" if operation_name.startswith(('Create', 'Update')) else "String"
         response_type = f"{operation_name}ResponseContent"
@@ -580,7 +876,7 @@ class HexagonalArchitectureGenerator:
         # Extract service name from operation if not provided
         if not service_name:
             # Default service name extraction logic
-            for entity in ['User', 'Movie', 'Location']:
+            for entity in _KNOWN_SERVICE_ENTITIES:
                 if entity in operation_name:
                     service_name = entity.lower()
                     break
@@ -588,11 +884,10 @@ class HexagonalArchitectureGenerator:
                 service_name = 'default'
         
         # Check if types are Java native types
-        java_types = {'String', 'Integer', 'Long', 'Boolean', 'Double', 'Float', 'Object', 'Void'}
-        request_is_java_type = request_type in java_types
-        response_is_java_type = response_type in java_types
+        request_is_java_type = request_type in _JAVA_NATIVE_TYPES
+        response_is_java_type = response_type in _JAVA_NATIVE_TYPES
         
-        context.update({
+        context = {
             'packageName': self.target_packages['domain_ports_input'],
             'classname': f"{operation_name}UseCase",
             'operationName': operation_name,
@@ -604,10 +899,10 @@ class HexagonalArchitectureGenerator:
             'interfaceOnly': True,
             'isUseCasePort': True,
             'isUpdateOperation': operation_name.startswith('Update')
-        })
+        }
         
         content = self._render_template('interface.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['domain_ports_input']) / f"{operation_name}UseCase.java"
+        file_path = self._package_paths['domain_ports_input'] / f"{operation_name}UseCase.java"
         self._write_file(file_path, content)
     
     def generate_consolidated_service(self, entity_name: str, operations: List[Dict[str, Any]], complex_operations: List[str] = None, service_name: str = None):
@@ -620,7 +915,6 @@ class HexagonalArchitectureGenerator:
             complex_operations: List of complex operation IDs for this entity
             service_name: Service name for DTO organization
         """
-        context = self.mustache_context.copy()
         entity_var_name = entity_name.lower()
         
         # Extract service name from operations if not provided
@@ -628,24 +922,17 @@ class HexagonalArchitectureGenerator:
             service_name = operations[0]['service'] if operations else entity_var_name
         
         # Analyze available operations
-        has_create = any(op['id'].startswith('Create') and entity_name in op['id'] for op in operations)
-        has_get = any(op['id'].startswith('Get') and entity_name in op['id'] for op in operations)
-        has_update = any(op['id'].startswith('Update') and entity_name in op['id'] for op in operations)
-        has_delete = any(op['id'].startswith('Delete') and entity_name in op['id'] for op in operations)
-        has_list = any(op['id'] == f'List{entity_name}s' for op in operations)
+        op_ids = {op['id'] for op in operations}
+        has_create = f'Create{entity_name}' in op_ids
+        has_get = f'Get{entity_name}' in op_ids
+        has_update = f'Update{entity_name}' in op_ids
+        has_delete = f'Delete{entity_name}' in op_ids
+        has_list = f'List{entity_name}s' in op_ids
         
         # Build complex operations info
-        complex_ops_info = []
-        if complex_operations:
-            for op in complex_operations:
-                method_name = op[0].lower() + op[1:] if op else ''
-                complex_ops_info.append({
-                    'operationId': op,
-                    'methodName': method_name,
-                    'responseType': f'{op}ResponseContent'
-                })
+        complex_ops_info = [self._get_complex_operation_info(op) for op in complex_operations or ()]
         
-        context.update({
+        context = {
             'packageName': self.target_packages['application_service'],
             'classname': f"{entity_name}Service",
             'entityName': entity_name,
@@ -659,7 +946,7 @@ class HexagonalArchitectureGenerator:
             'hasComplexOperations': len(complex_ops_info) > 0,
             'complexOperations': complex_ops_info,
             'isApplicationService': True
-        })
+        }
         
         # Add type information for each operation
         if has_create:
@@ -699,34 +986,10 @@ class HexagonalArchitectureGenerator:
             })
         
         content = self._render_template('consolidatedService.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['application_service']) / f"{entity_name}Service.java"
+        file_path = self._package_paths['application_service'] / f"{entity_name}Service.java"
         self._write_file(file_path, content)
     
     def generate_consolidated_use_cases(self, entity_name: str, operations: List[Dict[str, Any]], complex_operations: List[str] = None, service_name: str = None):
-        """
-        Generate consolidated use case interfaces for an entity.
-
-        Args:
-            entity_name: Name of the entity
-            operations: List of operation dictionaries for this entity
-            complex_operations: List of complex operation IDs for this entity
-            service_name: Service name for DTO organization
-        """
-        # Extract service name from operations if not provided
-        if not service_name:
-            service_name = operations[0]['service'] if operations else entity_name.lower()
-        
-        # Analyze available operations
-        has_create = any(op['id'].startswith('Create') and entity_name in op['id'] for op in operations)
-        has_get = any(op['id'].startswith('Get') and entity_name in op['id'] for op in operations)
-        has_update = any(op['id'].startswith('Update') and entity_name in op['id'] for op in operations)
-        has_delete = any(op['id'].startswith('Delete') and entity_name in op['id'] for op in operations)
-        has_list = any(op['id'] == f'List{entity_name}s' for op in operations)
-        
-        # Generate consolidated use case interface
-        self._generate_consolidated_use_case_interface(entity_name, operations, complex_operations, service_name)
-    
-    def _generate_consolidated_use_case_interface(self, entity_name: str, operations: List[Dict[str, Any]], complex_operations: List[str] = None, service_name: str = None):
         """
         Generate consolidated use case interface for an entity.
 
@@ -741,7 +1004,7 @@ class HexagonalArchitectureGenerator:
             service_name = operations[0]['service'] if operations else entity_name.lower()
         
         # Check which DTOs actually exist
-        dto_base_path = self.output_dir / self._get_package_path(self.target_packages['application_dto']) / service_name
+        dto_base_path = self._package_paths['application_dto'] / service_name
         
         # Check for each operation's DTOs
         has_create = self._check_dto_exists(dto_base_path, f'Create{entity_name}RequestContent') and self._check_dto_exists(dto_base_path, f'Create{entity_name}ResponseContent')
@@ -752,19 +1015,13 @@ class HexagonalArchitectureGenerator:
         has_list = self._check_dto_exists(dto_base_path, f'List{entity_name}sResponseContent')
         
         # Build complex operations info
-        complex_ops_info = []
-        if complex_operations:
-            for op in complex_operations:
-                if self._check_dto_exists(dto_base_path, f'{op}ResponseContent'):
-                    method_name = op[0].lower() + op[1:] if op else ''
-                    complex_ops_info.append({
-                        'operationId': op,
-                        'methodName': method_name,
-                        'responseType': f'{op}ResponseContent'
-                    })
-        
-        context = self.mustache_context.copy()
-        context.update({
+        complex_ops_info = [
+            self._get_complex_operation_info(op)
+            for op in complex_operations or ()
+            if self._check_dto_exists(dto_base_path, f'{op}ResponseContent')
+        ]
+        
+        context = {
             'packageName': self.target_packages['domain_ports_input'],
             'classname': f'{entity_name}UseCase',
             'entityName': entity_name,
@@ -777,16 +1034,19 @@ class HexagonalArchitectureGenerator:
             'hasList': has_list,
             'hasComplexOperations': len(complex_ops_info) > 0,
             'complexOperations': complex_ops_info
-        })
+        }
         
         content = self._render_template('consolidatedUseCase.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['domain_ports_input']) / f'{entity_name}UseCase.java'
+        file_path = self._package_paths['domain_ports_input'] / f'{entity_name}UseCase.java'
         self._write_file(file_path, content)
     
     def _check_dto_exists(self, dto_base_path: Path, dto_name: str) -> bool:
         """
         Check if a DTO file exists.
 
+        Each DTO directory is listed once; files written afterwards are added to the
+        cached listing by _write_file.
+
         Args:
             dto_base_path: Base path to the DTO directory
             dto_name: Name of the DTO class
@@ -794,8 +1054,55 @@ class HexagonalArchitectureGenerator:
         Returns:
             True if the DTO file exists, False otherwise
         """
-        dto_file_path = dto_base_path / f'{dto_name}.java'
-        return dto_file_path.exists()
+        listed_names = self._dto_dir_cache.get(dto_base_path)
+        if listed_names is None:
+            self._wait_for_writes()
+            try:
+                with os.scandir(dto_base_path) as entries:
+                    listed_names = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                listed_names = set()
+            self._dto_dir_cache[dto_base_path] = listed_names
+        return f'{dto_name}.java' in listed_names
+    
+    def _get_complex_operation_info(self, op: str) -> Dict[str, str]:
+        """
+        Get the template entry describing a complex (non-CRUD) operation.
+
+        The entry is built once per operation and shared by every template that
+        lists complex operations, so it must not be modified by callers.
+
+        Args:
+            op: Operation ID (e.g., GetCitiesByRegion)
+
+        Returns:
+            Dictionary with operationId, methodName, pathSegment and responseType
+        """
+        info = self._complex_op_info.get(op)
+        if info is None:
+            # Extract method info from operation name (e.g., GetCitiesByRegion -> getCitiesByRegion)
+            info = self._complex_op_info[op] = {
+                'operationId': op,
+                'methodName': op[0].lower() + op[1:] if op else '',
+                'pathSegment': op.lower().replace('get', '').replace('by', '-by-') if op.startswith('Get') else op.lower(),
+                'responseType': f'{op}ResponseContent'
+            }
+        return info
+    
+    def _get_dto_import_prefix(self, service_name: str) -> str:
+        """
+        Get the package prefix for DTO imports of a service.
+
+        Args:
+            service_name: Service folder the DTOs were generated into
+
+        Returns:
+            Prefix ending in '.', to be concatenated with a DTO class name
+        """
+        prefix = self._dto_import_prefix.get(service_name)
+        if prefix is None:
+            prefix = self._dto_import_prefix[service_name] = f'{self.target_packages["application_dto"]}.{service_name}.'
+        return prefix
     
     def generate_rest_controller(self, api_name: str, available_operations: List[str], service_name: str = None):
         """
@@ -806,77 +1113,57 @@ class HexagonalArchitectureGenerator:
             available_operations: List of operation IDs available for this entity
             service_name: Service name for DTO imports
         """
+        api_var_name = api_name.lower()
+        
         # Find service name from operations if not provided
         if not service_name:
-            for op in available_operations:
-                for spec_info in self.openapi_specs:
-                    if any(op in paths_data.get('operationId', '') for paths_data in 
-                          [method_data for path_data in spec_info['spec'].get('paths', {}).values() 
-                           for method_data in path_data.values() if isinstance(method_data, dict)]):
-                        service_name = spec_info['service_name']
-                        break
-                if service_name:
-                    break
+            service_name = next((self.operation_services[op] for op in available_operations if op in self.operation_services), None)
         
         if not service_name:
-            service_name = api_name.lower()
+            service_name = api_var_name
         
         # Separate CRUD and complex operations
         crud_operations = [op for op in available_operations if any(op.startswith(prefix + api_name) for prefix in ['Create', 'Get', 'Update', 'Delete']) or op == f'List{api_name}s']
         complex_operations = [op for op in available_operations if op not in crud_operations]
         
-        # Generate specific DTO imports for CRUD operations
-        dto_imports = []
-        if f'Create{api_name}' in available_operations:
-            dto_imports.extend([
-                f'{self.target_packages["application_dto"]}.{service_name}.Create{api_name}RequestContent',
-                f'{self.target_packages["application_dto"]}.{service_name}.Create{api_name}ResponseContent'
-            ])
-        if f'Get{api_name}' in available_operations:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.Get{api_name}ResponseContent')
-        if f'Update{api_name}' in available_operations:
-            dto_imports.extend([
-                f'{self.target_packages["application_dto"]}.{service_name}.Update{api_name}RequestContent',
-                f'{self.target_packages["application_dto"]}.{service_name}.Update{api_name}ResponseContent'
-            ])
-        if f'Delete{api_name}' in available_operations:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.Delete{api_name}ResponseContent')
-        if f'List{api_name}s' in available_operations:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.List{api_name}sResponseContent')
-        
-        # Add DTO imports for complex operations
-        for op in complex_operations:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.{op}ResponseContent')
+        has_create = f'Create{api_name}' in available_operations
+        has_get = f'Get{api_name}' in available_operations
+        has_update = f'Update{api_name}' in available_operations
+        has_delete = f'Delete{api_name}' in available_operations
+        has_list = f'List{api_name}s' in available_operations
+        
+        # Generate specific DTO imports for CRUD operations, then complex operations
+        prefix = self._get_dto_import_prefix(service_name)
+        dto_candidates = [
+            (has_create, f'Create{api_name}RequestContent'),
+            (has_create, f'Create{api_name}ResponseContent'),
+            (has_get, f'Get{api_name}ResponseContent'),
+            (has_update, f'Update{api_name}RequestContent'),
+            (has_update, f'Update{api_name}ResponseContent'),
+            (has_delete, f'Delete{api_name}ResponseContent'),
+            (has_list, f'List{api_name}sResponseContent'),
+        ]
+        dto_imports = [prefix + dto_name for present, dto_name in dto_candidates if present]
+        dto_imports.extend(prefix + f'{op}ResponseContent' for op in complex_operations)
         
         # Generate consolidated UseCase import
         usecase_imports = [f'{self.target_packages["domain_ports_input"]}.{api_name}UseCase']
         
         # Build complex operations info for template
-        complex_ops_info = []
-        for op in complex_operations:
-            # Extract method info from operation name (e.g., GetCitiesByRegion -> getCitiesByRegion)
-            method_name = op[0].lower() + op[1:] if op else ''
-            path_segment = op.lower().replace('get', '').replace('by', '-by-') if op.startswith('Get') else op.lower()
-            complex_ops_info.append({
-                'operationId': op,
-                'methodName': method_name,
-                'pathSegment': path_segment,
-                'responseType': f'{op}ResponseContent'
-            })
+        complex_ops_info = [self._get_complex_operation_info(op) for op in complex_operations]
         
-        context = self.mustache_context.copy()
-        context.update({
+        context = {
             'packageName': self.target_packages['infra_adapters_input_rest'],
             'classname': f"{api_name}Controller",
             'entityName': api_name,
-            'entityVarName': api_name.lower(),
-            'entityPath': api_name.lower() + 's',
-            'entityIdPath': f'{{{api_name.lower()}Id}}',
-            'hasCreate': f'Create{api_name}' in available_operations,
-            'hasGet': f'Get{api_name}' in available_operations,
-            'hasUpdate': f'Update{api_name}' in available_operations,
-            'hasDelete': f'Delete{api_name}' in available_operations,
-            'hasList': f'List{api_name}s' in available_operations,
+            'entityVarName': api_var_name,
+            'entityPath': api_var_name + 's',
+            'entityIdPath': f'{{{api_var_name}Id}}',
+            'hasCreate': has_create,
+            'hasGet': has_get,
+            'hasUpdate': has_update,
+            'hasDelete': has_delete,
+            'hasList': has_list,
             'hasComplexOperations': len(complex_operations) > 0,
             'complexOperations': complex_ops_info,
             'serviceName': service_name,
@@ -884,10 +1171,10 @@ class HexagonalArchitectureGenerator:
             'useCaseImports': usecase_imports,
             'isController': True,
             'useSpringWeb': True
-        })
+        }
         
         content = self._render_template('apiController.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_adapters_input_rest']) / f"{api_name}Controller.java"
+        file_path = self._package_paths['infra_adapters_input_rest'] / f"{api_name}Controller.java"
         self._write_file(file_path, content)
     
     def generate_mapper(self, entity_name: str, service_name: str = None):
@@ -899,13 +1186,11 @@ class HexagonalArchitectureGenerator:
             service_name: Service name for DTO imports
         """
         # Check if DTOs exist for this entity
-        dto_base_path = self.output_dir / self._get_package_path(self.target_packages['application_dto'])
+        dto_base_path = self._package_paths['application_dto']
         
         # Find service name if not provided
-        if not service_name:
-            for spec_info in self.openapi_specs:
-                service_name = spec_info['service_name']
-                break
+        if not service_name and self.openapi_specs:
+            service_name = self.openapi_specs[0]['service_name']
         
         if not service_name:
             service_name = entity_name.lower()
@@ -923,41 +1208,41 @@ class HexagonalArchitectureGenerator:
         has_list_response_dto = False
         has_get_dto = False
         
-        for service_folder in dto_base_path.iterdir():
-            if service_folder.is_dir():
-                if (service_folder / f"{create_dto_name}.java").exists():
-                    has_create_dto = True
-                    service_name = service_folder.name
-                if (service_folder / f"{update_dto_name}.java").exists():
-                    has_update_dto = True
-                    service_name = service_folder.name
-                if (service_folder / f"{response_dto_name}.java").exists():
-                    has_response_dto = True
-                    service_name = service_folder.name
-                if (service_folder / f"{list_response_dto_name}.java").exists():
-                    has_list_response_dto = True
-                    service_name = service_folder.name
-                if (service_folder / f"Get{entity_name}ResponseContent.java").exists():
-                    has_get_dto = True
-                    service_name = service_folder.name
+        with os.scandir(dto_base_path) as entries:
+            service_folders = [Path(entry.path) for entry in entries if entry.is_dir()]
+        
+        # Folder listings are cached, so each probe is a set lookup rather than a stat()
+        for service_folder in service_folders:
+            if self._check_dto_exists(service_folder, create_dto_name):
+                has_create_dto = True
+                service_name = service_folder.name
+            if self._check_dto_exists(service_folder, update_dto_name):
+                has_update_dto = True
+                service_name = service_folder.name
+            if self._check_dto_exists(service_folder, response_dto_name):
+                has_response_dto = True
+                service_name = service_folder.name
+            if self._check_dto_exists(service_folder, list_response_dto_name):
+                has_list_response_dto = True
+                service_name = service_folder.name
+            if self._check_dto_exists(service_folder, f"Get{entity_name}ResponseContent"):
+                has_get_dto = True
+                service_name = service_folder.name
         
         # Build imports for DTOs
-        dto_imports = []
-        if has_create_dto:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.{create_dto_name}')
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.Create{entity_name}ResponseContent')
-        if has_update_dto:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.{update_dto_name}')
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.Update{entity_name}ResponseContent')
-        if has_response_dto:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.{response_dto_name}')
-        if has_list_response_dto:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.{list_response_dto_name}')
-        if has_get_dto:
-            dto_imports.append(f'{self.target_packages["application_dto"]}.{service_name}.Get{entity_name}ResponseContent')
-        
-        context = self.mustache_context.copy()
-        context.update({
+        prefix = self._get_dto_import_prefix(service_name)
+        dto_candidates = [
+            (has_create_dto, create_dto_name),
+            (has_create_dto, f'Create{entity_name}ResponseContent'),
+            (has_update_dto, update_dto_name),
+            (has_update_dto, f'Update{entity_name}ResponseContent'),
+            (has_response_dto, response_dto_name),
+            (has_list_response_dto, list_response_dto_name),
+            (has_get_dto, f'Get{entity_name}ResponseContent'),
+        ]
+        dto_imports = [prefix + dto_name for present, dto_name in dto_candidates if present]
+        
+        context = {
             'packageName': self.target_packages['application_mapper'],
             'classname': f"{entity_name}Mapper",
             'entityName': entity_name,
@@ -975,10 +1260,10 @@ class HexagonalArchitectureGenerator:
             'listResponseDtoName': list_response_dto_name,
             'dtoImports': dto_imports,
             'isMapper': True
-        })
+        }
         
         content = self._render_template('apiMapper.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['application_mapper']) / f"{entity_name}Mapper.java"
+        file_path = self._package_paths['application_mapper'] / f"{entity_name}Mapper.java"
         self._write_file(file_path, content)
     
     def generate_main_application(self):
@@ -987,15 +1272,14 @@ class HexagonalArchitectureGenerator:
 
         Creates the main entry point class with @SpringBootApplication annotation.
         """
-        context = self.mustache_context.copy()
         main_class_name = self.project_config['project']['params']['configOptions']['mainClass']  # UserServiceApplication
-        context.update({
+        context = {
             'packageName': self.target_packages['root'],
             'classname': main_class_name  # UserServiceApplication (no extra Application)
-        })
+        }
         
         content = self._render_template('Application.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['root']) / f"{main_class_name}.java"  # UserServiceApplication.java
+        file_path = self._package_paths['root'] / f"{main_class_name}.java"  # UserServiceApplication.java
         self._write_file(file_path, content)
     
     def generate_configuration(self):
@@ -1006,14 +1290,13 @@ class HexagonalArchitectureGenerator:
         exception handling, and application configuration.
         """
         # Generate main application configuration
-        context = self.mustache_context.copy()
-        context.update({
+        context = {
             'packageName': self.target_packages['infra_config'],
             'classname': 'ApplicationConfiguration'
-        })
+        }
         
         content = self._render_template('Configuration.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_config']) / "ApplicationConfiguration.java"
+        file_path = self._package_paths['infra_config'] / "ApplicationConfiguration.java"
         self._write_file(file_path, content)
         
         # Generate security configuration
@@ -1023,7 +1306,7 @@ class HexagonalArchitectureGenerator:
         })
         
         content = self._render_template('SecurityConfiguration.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_config']) / "SecurityConfiguration.java"
+        file_path = self._package_paths['infra_config'] / "SecurityConfiguration.java"
         self._write_file(file_path, content)
         
         # Generate OpenAPI configuration
@@ -1033,7 +1316,7 @@ class HexagonalArchitectureGenerator:
         })
         
         content = self._render_template('OpenApiConfiguration.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_config']) / "OpenApiConfiguration.java"
+        file_path = self._package_paths['infra_config'] / "OpenApiConfiguration.java"
         self._write_file(file_path, content)
         
         # Generate global exception handler
@@ -1043,7 +1326,7 @@ class HexagonalArchitectureGenerator:
         })
         
         content = self._render_template('GlobalExceptionHandler.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_config_exceptions']) / "GlobalExceptionHandler.java"
+        file_path = self._package_paths['infra_config_exceptions'] / "GlobalExceptionHandler.java"
         self._write_file(file_path, content)
         
         # Generate NotFoundException
@@ -1053,7 +1336,7 @@ class HexagonalArchitectureGenerator:
         })
         
         content = self._render_template('NotFoundException.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['infra_config_exceptions']) / "NotFoundException.java"
+        file_path = self._package_paths['infra_config_exceptions'] / "NotFoundException.java"
         self._write_file(file_path, content)
         
         # Generate LoggingUtils
@@ -1063,7 +1346,7 @@ class HexagonalArchitectureGenerator:
         })
         
         content = self._render_template('LoggingUtils.mustache', context)
-        file_path = self.output_dir / self._get_package_path(self.target_packages['utils']) / "LoggingUtils.java"
+        file_path = self._package_paths['utils'] / "LoggingUtils.java"
         self._write_file(file_path, content)
     
     def generate_pom_xml(self):
@@ -1072,7 +1355,7 @@ class HexagonalArchitectureGenerator:
 
         Creates the project's Maven configuration with dependencies and build settings.
         """
-        content = self._render_template('pom.xml.mustache', self.mustache_context)
+        content = self._render_template('pom.xml.mustache')
         file_path = self.output_dir / "pom.xml"
         self._write_file(file_path, content)
     
@@ -1082,7 +1365,7 @@ class HexagonalArchitectureGenerator:
 
         Creates Spring Boot configuration properties including database settings.
         """
-        content = self._render_template('application.properties.mustache', self.mustache_context)
+        content = self._render_template('application.properties.mustache')
         file_path = self.output_dir / "src/main/resources/application.properties"
         self._write_file(file_path, content)
     
@@ -1092,7 +1375,7 @@ class HexagonalArchitectureGenerator:
 
         Creates documentation with project information and usage instructions.
         """
-        content = self._render_template('README.md.mustache', self.mustache_context)
+        content = self._render_template('README.md.mustache')
         file_path = self.output_dir / "README.md"
         self._write_file(file_path, content)
     
@@ -1102,7 +1385,7 @@ class HexagonalArchitectureGenerator:
 
         Creates Docker Compose configuration for running the database container.
         """
-        content = self._render_template('docker-compose.yml.mustache', self.mustache_context)
+        content = self._render_template('docker-compose.yml.mustache')
         file_path = self.output_dir / "docker-compose.yml"
         self._write_file(file_path, content)
     
@@ -1112,7 +1395,7 @@ class HexagonalArchitectureGenerator:
 
         Creates Docker configuration for building and running the application container.
         """
-        content = self._render_template('Dockerfile.mustache', self.mustache_context)
+        content = self._render_template('Dockerfile.mustache')
         file_path = self.output_dir / "Dockerfile"
         self._write_file(file_path, content)
     
@@ -1123,68 +1406,58 @@ class HexagonalArchitectureGenerator:
         Creates mvnw scripts and .mvn/wrapper/maven-wrapper.properties.
         """
         # Generate Unix/Linux/macOS wrapper
-        content = self._render_template('mvnw.mustache', self.mustache_context)
+        content = self._render_template('mvnw.mustache')
         file_path = self.output_dir / "mvnw"
-        self._write_file(file_path, content)
         # Make mvnw executable
-        import os
-        os.chmod(file_path, 0o755)
+        self._write_file(file_path, content, mode=0o755)
         
         # Generate Windows wrapper
-        content = self._render_template('mvnw.cmd.mustache', self.mustache_context)
+        content = self._render_template('mvnw.cmd.mustache')
         file_path = self.output_dir / "mvnw.cmd"
         self._write_file(file_path, content)
         
         # Generate Maven wrapper properties
         wrapper_dir = self.output_dir / ".mvn" / "wrapper"
         self._ensure_directory(wrapper_dir)
-        content = self._render_template('maven-wrapper.properties.mustache', self.mustache_context)
+        content = self._render_template('maven-wrapper.properties.mustache')
         file_path = wrapper_dir / "maven-wrapper.properties"
         self._write_file(file_path, content)
     
+    def _discard_writes(self):
+        """
+        Cancel queued file writes and wait for those already running.
+
+        Nothing is left to discard after a successful _wait_for_writes(); after a
+        failure, this keeps the project's writes from outliving it.
+        """
+        pending_writes, self._pending_writes = self._pending_writes, []
+        for future in pending_writes:
+            future.cancel()
+        wait(pending_writes)
+    
     def generate_complete_project(self):
         """
         Generate complete Hexagonal Architecture project from OpenAPI specs.
 
         Orchestrates the generation of all project components including domain models,
         application services, infrastructure adapters, and supporting files.
-        """
-        print("Generating Hexagonal Architecture Spring Boot project from OpenAPI specs...")
-        
-        all_schemas = {}
-        all_operations = []
-        all_entities = set()
         
-        # Process each OpenAPI spec
-        for spec_info in self.openapi_specs:
-            openapi_spec = spec_info['spec']
-            service_name = spec_info['service_name']
-            
-            print(f"Processing {service_name} service...")
-            
-            # Extract data from OpenAPI spec
-            schemas = openapi_spec.get('components', {}).get('schemas', {})
-            paths = openapi_spec.get('paths', {})
+        Returns:
+            Summary of the generated project (name, version, counts and entity names)
+        """
+        try:
+            logger.info("Generating Hexagonal Architecture Spring Boot project from OpenAPI specs...")
             
-            # Store schemas with service context
-            for schema_name, schema_data in schemas.items():
-                all_schemas[f"{service_name}_{schema_name}"] = {
-                    'data': schema_data,
-                    'service': service_name,
-                    'original_name': schema_name
-                }
+            all_schemas = self.spec_schemas
+            all_operations = self.spec_operations
             
-            # Extract operations
-            for path, methods in paths.items():
-                for method, operation_data in methods.items():
-                    if 'operationId' in operation_data:
-                        all_operations.append({
-                            'id': operation_data['operationId'],
-                            'service': service_name
-                        })
+            for spec_info in self.openapi_specs:
+                logger.info("Processing %s service...", spec_info['service_name'])
             
             # Extract entities from schemas (look for Response schemas)
-            for schema_name in schemas.keys():
+            all_entities = set()
+            for schema_info in all_schemas.values():
+                schema_name = schema_info['original_name']
                 if schema_name.endswith('Response') or schema_name.endswith('ResponseContent'):
                     entity_name = schema_name.replace('Response', '').replace('ResponseContent', '')
                     if entity_name.startswith('Get'):
@@ -1192,214 +1465,628 @@ class HexagonalArchitectureGenerator:
                     
                     if entity_name:
                         all_entities.add(entity_name)
-        
-        # Generate DTOs from all schemas (excluding Error DTOs)
-        for schema_key, schema_info in all_schemas.items():
-            if schema_info['data'].get('type') == 'object' and 'Error' not in schema_info['original_name']:
-                self.generate_dto(schema_info['original_name'], schema_info['data'], schema_info['service'])
-        
-        # Generate EntityStatus enum
-        self.generate_entity_status_enum()
-        
-        # Generate domain models for all entities
-        for entity in all_entities:
-            # Find the main response schema for this entity
-            entity_schema = None
+            
+            # Generate DTOs from all schemas (excluding Error DTOs)
             for schema_key, schema_info in all_schemas.items():
+                if schema_info['data'].get('type') == 'object' and 'Error' not in schema_info['original_name']:
+                    self.generate_dto(schema_info['original_name'], schema_info['data'], schema_info['service'])
+            
+            # Generate EntityStatus enum
+            self.generate_entity_status_enum()
+            
+            # Find the main response schema for each entity ({Entity}Response or
+            # Get{Entity}ResponseContent); the first matching schema wins
+            entity_schemas = {}
+            for schema_info in all_schemas.values():
                 original_name = schema_info['original_name']
-                if original_name == f'{entity}Response' or original_name == f'Get{entity}ResponseContent':
-                    entity_schema = schema_info['data']
-                    break
+                if original_name.endswith('Response'):
+                    entity_schemas.setdefault(original_name[:-len('Response')], schema_info['data'])
+                elif original_name.startswith('Get') and original_name.endswith('ResponseContent'):
+                    entity_schemas.setdefault(original_name[len('Get'):-len('ResponseContent')], schema_info['data'])
             
-            if entity_schema:
-                self.generate_domain_model(entity, entity_schema)
-                self.generate_domain_port_output(entity)
-        
-        # Generate application layer mappers (only for domain entities, not DTOs)
-        domain_entities = set()
-        for entity in all_entities:
-            # Only generate mappers for entities that have domain models (not DTOs)
-            if ('Error' not in entity and 'Content' not in entity and 
-                not entity.startswith(('Create', 'Get', 'Update', 'Delete', 'List'))):
-                domain_entities.add(entity)
-        
-        for entity in domain_entities:
-            # Find service name for this entity
-            entity_service = None
-            for spec_info in self.openapi_specs:
-                if any(entity in schema_name for schema_name in spec_info['spec'].get('components', {}).get('schemas', {})):
-                    entity_service = spec_info['service_name']
-                    break
-            self.generate_mapper(entity, entity_service)
-        
-        # Group operations by entity for consolidated services
-        entity_operations = {}
-        for operation_info in all_operations:
-            # Extract entity name from operation - only for basic CRUD operations
-            entity_name = None
-            op_id = operation_info['id']
+            # Domain entities (not DTOs) get mappers and REST controllers
+            domain_entities = frozenset(
+                entity for entity in all_entities
+                if ('Error' not in entity and 'Content' not in entity and 
+                    not entity.startswith(('Create', 'Get', 'Update', 'Delete', 'List')))
+            )
             
-            # Only process basic CRUD operations that match domain entities
+            # Generate the per-entity domain, infrastructure and mapper classes in one pass
             for entity in all_entities:
-                if (op_id == f'Create{entity}' or op_id == f'Get{entity}' or 
-                    op_id == f'Update{entity}' or op_id == f'Delete{entity}' or 
-                    op_id == f'List{entity}s'):
-                    entity_name = entity
-                    break
+                entity_schema = entity_schemas.get(entity)
+                if entity_schema:
+                    # Domain layer
+                    self.generate_domain_model(entity, entity_schema)
+                    self.generate_domain_port_output(entity)
+                    # Infrastructure layer
+                    self.generate_entity(entity, entity_schema)
+                    self.generate_jpa_repository(entity, entity_schema)
+                    self.generate_repository_adapter(entity)
+                
+                # Application layer mappers (only for domain entities, not DTOs)
+                if entity in domain_entities:
+                    # Find service name for this entity
+                    entity_service = next((schema_info['service'] for schema_info in all_schemas.values() if entity in schema_info['original_name']), None)
+                    self.generate_mapper(entity, entity_service)
             
-            if entity_name:
-                if entity_name not in entity_operations:
-                    entity_operations[entity_name] = []
-                entity_operations[entity_name].append(operation_info)
-        
-        # Generate consolidated services and use cases for each entity
-        for entity_name, operations in entity_operations.items():
-            # Find complex operations for this entity
-            complex_operations = []
-            for op in all_operations:
-                op_id = op['id']
-                if (op_id not in [o['id'] for o in operations] and 
-                    (op_id.startswith('Get') and 'By' in op_id and 
-                     (entity_name.lower() in op_id.lower() or 
-                      any(related in op_id for related in ['Cities', 'Countries', 'Regions', 'Neighborhoods']) and entity_name == 'Location'))):
-                    complex_operations.append(op_id)
+            # Group operations by entity for consolidated services
+            entity_operations = {}
+            for operation_info in all_operations:
+                # Extract entity name from operation - only for basic CRUD operations
+                match = _CRUD_OPERATION_RE.fullmatch(operation_info['id'])
+                if not match:
+                    continue
+                verb, entity_name = match.groups()
+                if verb == 'List':
+                    entity_name = entity_name[:-1] if entity_name.endswith('s') else None
+                
+                # Only process basic CRUD operations that match domain entities
+                if entity_name in all_entities:
+                    if entity_name not in entity_operations:
+                        entity_operations[entity_name] = []
+                    entity_operations[entity_name].append(operation_info)
             
-            # Generate consolidated use case interfaces
-            self.generate_consolidated_use_cases(entity_name, operations, complex_operations)
-            # Generate consolidated service
-            self.generate_consolidated_service(entity_name, operations, complex_operations)
-        
-        # Generate infrastructure layer
-        for entity in all_entities:
-            # Find entity schema
-            entity_schema = None
-            for schema_key, schema_info in all_schemas.items():
-                original_name = schema_info['original_name']
-                if original_name == f'{entity}Response' or original_name == f'Get{entity}ResponseContent':
-                    entity_schema = schema_info['data']
-                    break
+            # Lookup operations (GetXByY) are the only candidates for complex operations
+            lookup_ops = [(op['id'], op['id'].lower()) for op in all_operations if op['id'].startswith('Get') and 'By' in op['id']]
             
-            if entity_schema:
-                self.generate_entity(entity, entity_schema)
-                self.generate_jpa_repository(entity, entity_schema)
-                self.generate_repository_adapter(entity)
-        
-        # Generate REST controllers for entities with consolidated use cases + complex operations
-        for entity_name in entity_operations.keys():
-            if ('Error' not in entity_name and 'Content' not in entity_name and 
-                not entity_name.startswith(('Create', 'Get', 'Update', 'Delete', 'List'))):
-                # Find CRUD operations for this entity
-                crud_operations = [op['id'] for op in entity_operations[entity_name]]
-                
-                # Find complex operations related to this entity
-                complex_operations = []
-                for op in all_operations:
-                    op_id = op['id']
-                    # Check if operation is related to this entity but not a basic CRUD
-                    if (op_id not in crud_operations and 
-                        (op_id.startswith('Get') and 'By' in op_id and 
-                         (entity_name.lower() in op_id.lower() or 
-                          any(related in op_id for related in ['Cities', 'Countries', 'Regions', 'Neighborhoods']) and entity_name == 'Location'))):
-                        complex_operations.append(op_id)
-                
-                # Combine CRUD and complex operations
-                all_available_operations = crud_operations + complex_operations
+            # Find complex operations for each entity once; services, use cases and controllers share them
+            entity_complex_operations = {}
+            for entity_name, operations in entity_operations.items():
+                crud_op_ids = {op['id'] for op in operations}
+                entity_name_lower = entity_name.lower()
+                is_location = entity_name == 'Location'
+                entity_complex_operations[entity_name] = [
+                    op_id for op_id, op_id_lower in lookup_ops
+                    if op_id not in crud_op_ids and
+                    (entity_name_lower in op_id_lower or
+                     is_location and any(related in op_id for related in _LOCATION_RELATED_RESOURCES))
+                ]
+            
+            # Generate consolidated services and use cases for each entity
+            for entity_name, operations in entity_operations.items():
+                complex_operations = entity_complex_operations[entity_name]
                 
-                # Get service name from first operation
-                service_name = entity_operations[entity_name][0]['service'] if entity_operations[entity_name] else entity_name.lower()
-                self.generate_rest_controller(entity_name, all_available_operations, service_name)
-        
-        # Generate supporting files
-        self.generate_main_application()
-        self.generate_configuration()
-        self.generate_pom_xml()
-        self.generate_application_properties()
-        self.generate_readme()
-        self.generate_docker_compose()
-        self.generate_dockerfile()
-        self.generate_maven_wrapper()
-        
-        print(f"\nHexagonal Architecture project generated successfully in: {self.output_dir}")
+                # Generate consolidated use case interfaces
+                self.generate_consolidated_use_cases(entity_name, operations, complex_operations)
+                # Generate consolidated service
+                self.generate_consolidated_service(entity_name, operations, complex_operations)
+            
+            # Generate REST controllers for entities with consolidated use cases + complex operations
+            for entity_name in entity_operations.keys():
+                if entity_name in domain_entities:
+                    # Find CRUD operations for this entity
+                    crud_operations = [op['id'] for op in entity_operations[entity_name]]
+                    
+                    # Combine CRUD and complex operations
+                    all_available_operations = crud_operations + entity_complex_operations[entity_name]
+                    
+                    # Get service name from first operation
+                    service_name = entity_operations[entity_name][0]['service'] if entity_operations[entity_name] else entity_name.lower()
+                    self.generate_rest_controller(entity_name, all_available_operations, service_name)
+            
+            # Generate supporting files
+            self.generate_main_application()
+            self.generate_configuration()
+            self.generate_pom_xml()
+            self.generate_application_properties()
+            self.generate_readme()
+            self.generate_docker_compose()
+            self.generate_dockerfile()
+            self.generate_maven_wrapper()
+            self._wait_for_writes()
+        finally:
+            # A failed project must not leave writes queued for the next project or its restore
+            self._discard_writes()
+        
         project_info = self.project_config.get('project', {}).get('general', {})
-        print(f"Project: {project_info.get('name', 'generated-project')} v{project_info.get('version', '1.0.0')}")
-        print(f"Description: {project_info.get('description', 'Generated project')}")
-        print(f"Generated {len(all_schemas)} DTOs from {len(self.openapi_specs)} OpenAPI specs")
-        print(f"Generated {len(all_operations)} use cases from operations")
-        print(f"Generated {len(all_entities)} entities: {', '.join(sorted(all_entities))}")
-        print("\nProject structure follows Hexagonal Architecture principles:")
-        print("- Domain: Pure business logic and ports")
-        print("- Application: Use case implementations and DTOs")
-        print("- Infrastructure: External adapters (REST, JPA, Config)")
+        summary = {
+            'project': project_info.get('name', 'generated-project'),
+            'version': project_info.get('version', '1.0.0'),
+            'output_dir': str(self.output_dir),
+            'files': len(self.generated_files),
+            'dtos': len(all_schemas),
+            'specs': len(self.openapi_specs),
+            'use_cases': len(all_operations),
+            'entities': sorted(all_entities),
+        }
+        
+        # The report is a single record, so output from parallel workers does not interleave
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join([
+                *(f"Generated: {file_path}" for file_path in self.generated_files),
+                f"\nHexagonal Architecture project generated successfully in: {self.output_dir}",
+                f"Project: {summary['project']} v{summary['version']}",
+                f"Description: {project_info.get('description', 'Generated project')}",
+                f"Generated {summary['dtos']} DTOs from {summary['specs']} OpenAPI specs",
+                f"Generated {summary['use_cases']} use cases from operations",
+                f"Generated {len(summary['entities'])} entities: {', '.join(summary['entities'])}",
+                "\nProject structure follows Hexagonal Architecture principles:",
+                "- Domain: Pure business logic and ports",
+                "- Application: Use case implementations and DTOs",
+                "- Infrastructure: External adapters (REST, JPA, Config)",
+            ]))
+        return summary
 
 
-def run_command(cmd):
+def configure_logging():
     """
-    Execute a shell command and return its output.
-    
+    Send progress messages to stdout through a single handler.
+
+    The level defaults to INFO and can be changed with the CODEGEN_LOG environment
+    variable (e.g. CODEGEN_LOG=WARNING for quiet bulk runs). An unknown level name
+    falls back to INFO with a warning instead of failing the run.
+    """
+    level_name = os.environ.get("CODEGEN_LOG", "INFO").upper()
+    level = logging.getLevelNamesMapping().get(level_name)
+    # Forked workers inherit the configured handler; only the first call warns
+    already_configured = bool(logging.getLogger().handlers)
+    logging.basicConfig(level=logging.INFO if level is None else level, format="%(message)s", stream=sys.stdout)
+    if level is None and not already_configured:
+        logger.warning("Unknown CODEGEN_LOG level %r, using INFO", level_name)
+
+# Generator reused for every project handled by the current process
+_generator = None
+
+def _init_generator(config_path: str, templates_dir: str):
+    """
+    Create the generator shared by every project generated in this process.
+
+    Used as the process pool initializer so each worker builds it only once.
+
+    Args:
+        config_path: Path to the configuration JSON file
+        templates_dir: Directory containing Mustache templates
+    """
+    global _generator
+    configure_logging()
+    _generator = HexagonalArchitectureGenerator(config_path, templates_dir)
+
+def _generate_project(project_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate a single project with the process-wide generator.
+
+    Defined at module level so it can be dispatched to worker processes.
+
     Args:
-        cmd: Shell command to execute
+        project_config: Single project configuration from the array
         
     Returns:
-        Command output as string
+        Summary of the generated project, see generate_complete_project()
+    """
+    _generator.set_project(project_config)
+    return _generator.generate_complete_project()
+
+def emit_json_summary(summary: Dict[str, Any]):
+    """
+    Write one project's summary to stderr as a single compact JSON line.
+
+    Args:
+        summary: Project summary, or {'project', 'error'} for a failed project
+    """
+    sys.stderr.write(json.dumps(summary, separators=(",", ":")) + "\n")
+    sys.stderr.flush()
+
+def run_command(cmd):
+    """
+    Execute a command without a shell, streaming its output as it runs.
+    
+    The child inherits this process's stdout and stderr, so its output reaches the
+    terminal directly without being copied or decoded here. The executable is
+    resolved to a full path and descriptors are left to PEP 446 non-inheritance,
+    which lets subprocess start it with posix_spawn instead of fork + exec.
+    
+    Args:
+        cmd: Command to execute, as an argument list or a string split with shell syntax
         
     Raises:
         SystemExit: If command fails
     """
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    argv = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Running: %s", shlex.join(argv))
+    sys.stdout.flush()
+    result = subprocess.run(argv, executable=shutil.which(argv[0]) or argv[0], close_fds=False)
     if result.returncode != 0:
-        print(f"Error: {result.stderr}")
+        logger.error("Error: %s exited with status %d", argv[0], result.returncode)
         exit(1)
-    return result.stdout
 
-def main():
+def remove_tree(path: Path):
     """
-    Main entry point for the generator.
+    Remove a directory tree, deleting its top-level subtrees concurrently.
 
-    Handles command line arguments, loads configuration, and orchestrates
-    the project generation process for multiple projects.
+    Each generated project lives in its own subdirectory; unlink/rmdir release the GIL,
+    so removing the subtrees on separate threads overlaps their syscalls instead of
+    issuing them one at a time.
+
+    Args:
+        path: Path to the directory to remove
+    """
+    with os.scandir(path) as it:
+        subtrees = []
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subtrees.append(entry.path)
+            else:
+                os.unlink(entry.path)
+    if subtrees:
+        with ThreadPoolExecutor(max_workers=min(len(subtrees), os.cpu_count() or 1)) as executor:
+            list(executor.map(shutil.rmtree, subtrees))
+    os.rmdir(path)
+
+def reset_projects_directory(projects_dir: Path, cleanup: ThreadPoolExecutor, keep: frozenset = frozenset(),
+                             only: List[str] = None) -> Path:
+    """
+    Swap in an empty projects directory, stashing previous output instead of deleting it.
+
+    The old directory is renamed out of the way with a single os.replace (or, when some
+    projects are kept, one rename per outdated entry). Its contents stay in the stash
+    until each project has been regenerated, so a project that fails can get its
+    previous output back (see restore_previous_output). Leftovers from an interrupted
+    run are deleted in the background on the cleanup executor.
+
+    Args:
+        projects_dir: Path to the projects output directory
+        cleanup: Executor running background deletions; the caller must shut it down
+        keep: Names of up-to-date project subdirectories to leave in place
+        only: If given, only these project subdirectories are moved out of the way
+        
+    Returns:
+        The stash directory holding previous output, or None if nothing was moved
     """
-    print("📝 Generating OpenAPI from Smithy...")
-    run_command("smithy clean")
-    run_command("smithy build")
+    for stale_dir in projects_dir.parent.glob(f".{projects_dir.name}.old.*"):
+        cleanup.submit(remove_tree, stale_dir)
     
-    # Clean and create projects directory
-    projects_dir = Path("projects")
+    stash_dir = None
     if projects_dir.exists():
-        import shutil
-        shutil.rmtree(projects_dir)
-        print(f"🗑️ Cleaned existing projects directory")
+        new_stash_dir = projects_dir.with_name(f".{projects_dir.name}.old.{os.getpid()}-{time.time_ns()}")
+        if keep or only:
+            # Move everything but the kept projects out of the way, one rename each
+            with os.scandir(projects_dir) as entries:
+                outdated = [entry for entry in entries
+                            if entry.name not in keep and (only is None or entry.name in only)]
+            if outdated:
+                new_stash_dir.mkdir()
+                for entry in outdated:
+                    os.replace(entry.path, new_stash_dir / entry.name)
+                stash_dir = new_stash_dir
+                logger.info("🗑️ Cleaned outdated projects")
+        else:
+            os.replace(projects_dir, new_stash_dir)
+            stash_dir = new_stash_dir
+            logger.info("🗑️ Cleaned existing projects directory")
     projects_dir.mkdir(exist_ok=True)
-    print(f"📁 Created projects directory")
+    logger.info("📁 Created projects directory")
+    return stash_dir
+
+def restore_previous_output(projects_dir: Path, stash_dir: Path, project_name: str) -> bool:
+    """
+    Replace a project's partial output with its output from before this run.
+
+    Args:
+        projects_dir: Path to the projects output directory
+        stash_dir: Stash directory returned by reset_projects_directory, or None
+        project_name: Name of the project that failed to generate
+        
+    Returns:
+        True if previous output was restored; otherwise the partial output is removed
+    """
+    target = projects_dir / project_name
+    if target.exists():
+        shutil.rmtree(target)
+    previous = stash_dir / project_name if stash_dir else None
+    if previous is None or not previous.is_dir():
+        return False
+    os.replace(previous, target)
+    return True
+
+def clean_smithy_outputs(cleanup: ThreadPoolExecutor, build_dir: Path):
+    """
+    Do what `smithy clean` does without starting a JVM: clear the Smithy build output.
+
+    The output directory is renamed out of the way and deleted on the cleanup executor,
+    so `smithy build` can start immediately with an empty output directory.
+
+    Args:
+        cleanup: Executor running background deletions; the caller must shut it down
+        build_dir: Smithy build output directory, see smithy_output_dir()
+    """
+    for stale_dir in build_dir.parent.glob(f".{build_dir.name}.old.*"):
+        cleanup.submit(shutil.rmtree, stale_dir, ignore_errors=True)
+
+    old_build_dir = build_dir.with_name(f".{build_dir.name}.old.{os.getpid()}-{time.time_ns()}")
+    try:
+        os.replace(build_dir, old_build_dir)
+    except FileNotFoundError:
+        return
+    cleanup.submit(shutil.rmtree, old_build_dir, ignore_errors=True)
+
+def smithy_outputs_up_to_date(build_dir: Path, sources_dir: Path = Path("smithy")) -> bool:
+    """
+    Check whether the Smithy OpenAPI outputs are newer than every Smithy input.
 
-    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
-        print("Usage: python hexagonal-architecture-generator.py [templates_dir]")
-        print("Example: python hexagonal-architecture-generator.py templates/java")
-        print("Config: libs/config/params.json (array of project configurations)")
-        sys.exit(0)
+    Args:
+        build_dir: Smithy build output directory, see smithy_output_dir()
+        sources_dir: Directory containing the .smithy model files
+        
+    Returns:
+        True if OpenAPI specs exist and none of the inputs changed since they were built
+    """
+    outputs = list(build_dir.glob("*/openapi/*.openapi.json"))
+    if not outputs:
+        return False
     
-    config_path = "libs/config/params.json"
-    templates_dir = sys.argv[1] if len(sys.argv) > 1 else "templates/java"
+    inputs = [*sources_dir.rglob("*.smithy"), _SMITHY_CONFIG]
+    newest_input = max((p.stat().st_mtime_ns for p in inputs if p.exists()), default=0)
+    oldest_output = min(p.stat().st_mtime_ns for p in outputs)
+    return oldest_output > newest_input
+
+def project_stamps(projects_config: List[Dict[str, Any]], templates_dir: str, build_dir: Path) -> Dict[str, str]:
+    """
+    Fingerprint the inputs of every project.
+
+    A project's stamp covers its configuration entry and the inputs shared by all
+    projects: the OpenAPI specs, the templates and this script. Files are identified
+    by size and mtime rather than read.
+
+    Args:
+        projects_config: List of project configurations
+        templates_dir: Directory containing Mustache templates
+        build_dir: Smithy build output directory, see smithy_output_dir()
+        
+    Returns:
+        Dictionary of project name to stamp
+    """
+    spec_stats = []
+    with os.scandir(build_dir) as projections:
+        for projection in projections:
+            try:
+                with os.scandir(os.path.join(projection.path, "openapi")) as entries:
+                    spec_stats.extend((entry.path, entry.stat().st_size, entry.stat().st_mtime_ns)
+                                      for entry in entries if entry.name.endswith(".openapi.json"))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+    script_stat = os.stat(__file__)
+    shared_inputs = repr((sorted(spec_stats), _template_stats(Path(templates_dir)),
+                          script_stat.st_size, script_stat.st_mtime_ns)).encode('utf-8')
     
+    stamps = {}
+    for project_config in projects_config:
+        stamp = hashlib.blake2b(shared_inputs, digest_size=16)
+        stamp.update(json.dumps(project_config, sort_keys=True).encode('utf-8'))
+        stamps[project_config['project']['general']['name']] = stamp.hexdigest()
+    return stamps
+
+def load_project_stamps(stamp_path: Path = Path(".projects.stamp")) -> Dict[str, str]:
+    """
+    Load the project stamps recorded by the last successful run.
+
+    Args:
+        stamp_path: Path to the stamp file
+        
+    Returns:
+        Dictionary of project name to stamp; empty if there is no usable stamp file
+    """
     try:
-        # Load all project configurations
-        projects_config = HexagonalArchitectureGenerator.load_projects_config(config_path)
+        with open(stamp_path, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def save_project_stamps(stamps: Dict[str, str], stamp_path: Path = Path(".projects.stamp")):
+    """
+    Record the stamps of the projects generated by this run.
+
+    Args:
+        stamps: Dictionary of project name to stamp
+        stamp_path: Path to the stamp file
+    """
+    tmp_path = stamp_path.with_name(f"{stamp_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, stamp_path)
+
+def prepare_generation(config_path: str, templates_dir: str, cleanup: ThreadPoolExecutor, force: bool = False,
+                             only: List[str] = None):
+    """
+    Regenerate OpenAPI specs from Smithy and prepare the projects directory.
+
+    The previous Smithy output is cleared in-process (see clean_smithy_outputs), so only
+    one JVM is started: `smithy build`. The projects directory is reset only once the
+    build has succeeded, so a failed build leaves previous output in place. Smithy is
+    skipped when the specs are already up to date. In that case projects whose inputs
+    match the stamps of the last run are kept as they are, and only the others are
+    cleaned for regeneration.
+
+    Args:
+        config_path: Path to the configuration JSON file
+        templates_dir: Directory containing Mustache templates
+        cleanup: Executor running background deletions
+        force: Rebuild the OpenAPI specs and every project even if they are up to date
+        only: Names of the projects to regenerate; other projects are left untouched
         
-        print(f"Found {len(projects_config)} project(s) to generate...")
+    Returns:
+        Tuple of the configurations of the selected projects, the stash directory
+        holding previous output (None if there was none), the stamps to record once
+        the selected projects are generated, and the set of up-to-date project names
+        to skip
         
-        # Generate each project
-        for i, project_config in enumerate(projects_config, 1):
-            project_name = project_config['project']['general']['name']
-            print(f"\n[{i}/{len(projects_config)}] Generating project: {project_name}")
-            
-            generator = HexagonalArchitectureGenerator(config_path, templates_dir, project_config)
-            generator.generate_complete_project()
-            
-        print(f"\n✅ Successfully generated {len(projects_config)} project(s)!")
+    Raises:
+        ValueError: If a name passed in only is not a configured project
+    """
+    projects_dir = Path("projects")
+    projects_config = HexagonalArchitectureGenerator.load_projects_config(config_path)
+    if only:
+        project_names = [project_config['project']['general']['name'] for project_config in projects_config]
+        unknown_projects = set(only).difference(project_names)
+        if unknown_projects:
+            raise ValueError(f"Unknown project(s) for --only: {', '.join(sorted(unknown_projects))} "
+                             f"(available: {', '.join(project_names)})")
+    previous_stamps = load_project_stamps()
+    
+    build_dir = smithy_output_dir()
+    rebuild_specs = force or not smithy_outputs_up_to_date(build_dir)
+    if rebuild_specs:
+        logger.info("📝 Generating OpenAPI from Smithy...")
+        clean_smithy_outputs(cleanup, build_dir)
+        # run_command exits on failure, before projects/ has been touched
+        run_command("smithy build")
+        stash_dir = reset_projects_directory(projects_dir, cleanup, frozenset(), only)
+        stamps = project_stamps(projects_config, templates_dir, build_dir)
+        up_to_date = frozenset()
+    else:
+        logger.info("⏭️ OpenAPI specs are up to date, skipping Smithy (use --force to rebuild)")
+        stamps = project_stamps(projects_config, templates_dir, build_dir)
+        up_to_date = frozenset(name for name, stamp in stamps.items()
+                               if previous_stamps.get(name) == stamp and (projects_dir / name).is_dir()
+                               and (not only or name in only))
+        stash_dir = reset_projects_directory(projects_dir, cleanup, up_to_date, only)
+    
+    if only:
+        # Projects outside --only are not regenerated, so they keep whatever stamp they had
+        projects_config = [project_config for project_config in projects_config
+                           if project_config['project']['general']['name'] in only]
+        stamps = {name: stamp if name in only else previous_stamps.get(name) for name, stamp in stamps.items()}
+        stamps = {name: stamp for name, stamp in stamps.items() if stamp is not None}
+    
+    # Drop the stamps of projects about to be regenerated; they are written back on success
+    regenerated = {project_config['project']['general']['name'] for project_config in projects_config} - up_to_date
+    if regenerated.intersection(previous_stamps):
+        save_project_stamps({name: stamp for name, stamp in previous_stamps.items() if name not in regenerated})
+    return projects_config, stash_dir, stamps, up_to_date
+
+def parse_arguments(argv: List[str] = None):
+    """
+    Parse the generator's command line.
+
+    Args:
+        argv: Arguments to parse; defaults to sys.argv[1:]
+        
+    Returns:
+        argparse.Namespace with templates_dir, config, force, only, jobs and json
+    """
+    parser = argparse.ArgumentParser(
+        prog="hexagonal-architecture-generator.py",
+        description="Generate Hexagonal Architecture Spring Boot projects from Smithy/OpenAPI specs.",
+        epilog="Example: python hexagonal-architecture-generator.py templates/java --only back-ms-users",
+    )
+    parser.add_argument("templates_dir", nargs="?", default="templates/java",
+                        help="directory containing the Mustache templates (default: %(default)s)")
+    parser.add_argument("--config", default="libs/config/params.json",
+                        help="project configuration file, an array of projects (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild OpenAPI specs with Smithy and regenerate projects even if they are up to date")
+    parser.add_argument("--only", action="append", metavar="PROJECT",
+                        help="generate only the named project; repeat for several (other projects are left untouched)")
+    parser.add_argument("--jobs", type=int, metavar="N",
+                        help="maximum number of projects generated in parallel (default: CPU count)")
+    parser.add_argument("--json", action="store_true",
+                        help="also write one JSON summary line per project to stderr "
+                             "(combine with CODEGEN_LOG=WARNING for a quiet stdout)")
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+def main():
+    """
+    Main entry point for the generator.
+
+    Handles command line arguments, loads configuration, and orchestrates
+    the project generation process for multiple projects.
+    """
+    # Parsing happens first, so --help and usage errors never run Smithy or touch the projects directory
+    args = parse_arguments()
+    
+    configure_logging()
+    config_path = args.config
+    templates_dir = args.templates_dir
+    projects_dir = Path("projects")
+    # Previous output is deleted in the background while projects are generated
+    cleanup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="projects-cleanup")
+    
+    try:
+        # Run Smithy, reset the projects directory and load the selected project configurations
+        projects_config, stash_dir, stamps, up_to_date = prepare_generation(config_path, templates_dir, cleanup, args.force, args.only)
+        
+        # Projects whose inputs are unchanged since the last run keep their output
+        for project_name in sorted(up_to_date):
+            logger.info("⏭️ %s is up to date, skipping (use --force to regenerate)", project_name)
+        projects_config = [project_config for project_config in projects_config
+                           if project_config['project']['general']['name'] not in up_to_date]
+        project_count = len(projects_config)
+        project_names = [project_config['project']['general']['name'] for project_config in projects_config]
+        logger.info("Found %d project(s) to generate...", project_count)
+        
+        if project_count:
+            # Parse every template once up front; forked workers inherit them
+            preload_templates(templates_dir)
+        
+        # A failing project is reported and the others still complete; only the
+        # projects that succeeded get a stamp, so a rerun retries just the failures
+        failed_projects = []
+        if project_count == 1:
+            logger.info("\n[1/1] Generating project: %s", project_names[0])
+            try:
+                _init_generator(config_path, templates_dir)
+                summary = _generate_project(projects_config[0])
+            except Exception as e:
+                logger.error("Error generating project %s: %s", project_names[0], e, exc_info=True)
+                failed_projects.append(project_names[0])
+                summary = {'project': project_names[0], 'error': str(e)}
+            if args.json:
+                emit_json_summary(summary)
+        elif project_count > 1:
+            # Projects are independent (separate config entry and output directory), so generate them in parallel.
+            # Fork avoids re-importing this script in every worker where the platform supports it.
+            # Forking while other threads run is unsafe (and deprecated since Python 3.12), so let the
+            # queued deletions finish first; the fresh executor starts its thread on first use, after the fork.
+            cleanup.shutdown(wait=True)
+            cleanup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="projects-cleanup")
+            max_workers = min(project_count, args.jobs or os.cpu_count() or 1)
+            mp_context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                     initializer=_init_generator, initargs=(config_path, templates_dir)) as executor:
+                futures = {
+                    executor.submit(_generate_project, project_config): project_name
+                    for project_config, project_name in zip(projects_config, project_names)
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    try:
+                        summary = future.result()
+                    except Exception as e:
+                        logger.error("\n[%d/%d] Error generating project %s: %s", i, project_count, futures[future], e, exc_info=True)
+                        failed_projects.append(futures[future])
+                        summary = {'project': futures[future], 'error': str(e)}
+                    else:
+                        logger.info("\n[%d/%d] Generated project: %s", i, project_count, futures[future])
+                        if stash_dir:
+                            cleanup.submit(shutil.rmtree, stash_dir / futures[future], ignore_errors=True)
+                    if args.json:
+                        emit_json_summary(summary)
+        
+        # Failed projects get their previous output back instead of a partial one
+        for project_name in failed_projects:
+            if restore_previous_output(projects_dir, stash_dir, project_name):
+                logger.warning("↩️ Restored previous output of %s", project_name)
+        if stash_dir:
+            cleanup.submit(remove_tree, stash_dir)
+        
+        save_project_stamps({name: stamp for name, stamp in stamps.items() if name not in failed_projects})
+        if failed_projects:
+            logger.error("\n❌ Failed to generate %d of %d project(s): %s",
+                         len(failed_projects), project_count, ', '.join(sorted(failed_projects)))
+            sys.exit(1)
+        if project_count:
+            logger.info("\n✅ Successfully generated %d project(s)!", project_count)
+        else:
+            logger.info("\n✅ All projects are up to date")
         
     except Exception as e:
-        print(f"Error generating projects: {e}")
+        logger.error("Error generating projects: %s", e)
         sys.exit(1)
+    finally:
+        # Previous output is deleted in the background; finish before the interpreter shuts down
+        cleanup.shutdown(wait=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -47,19 +47,32 @@ else
     echo "✅ Dependencies satisfied"
 fi
 
-# Remove existing projects if they exist
-echo "🗑️  Cleaning up existing projects..."
-if [ -d "$PROJECT_ROOT/projects" ]; then
-    rm -rf "$PROJECT_ROOT/projects"
-fi
-echo "✅ Cleanup complete"
-
 echo ""
 echo "🏗️  Generating Hexagonal Architecture project..."
 echo ""
 
+# Use the default templates unless a templates directory was passed positionally;
+# the generator manages projects/ itself (up-to-date skips, --only, restore on failure)
+HAS_TEMPLATES_DIR=false
+EXPECT_VALUE=false
+for arg in "$@"; do
+    if [ "$EXPECT_VALUE" = true ]; then
+        EXPECT_VALUE=false
+        continue
+    fi
+    case "$arg" in
+        --config|--only|--jobs) EXPECT_VALUE=true ;;
+        -*) ;;
+        *) HAS_TEMPLATES_DIR=true; break ;;
+    esac
+done
+
 # Run the generator (config is now unified in libs/config/)
-python3 "$PROJECT_ROOT/libs/hexagonal-architecture-generator.py" "$TEMPLATES_DIR"
+if [ "$HAS_TEMPLATES_DIR" = true ]; then
+    python3 "$PROJECT_ROOT/libs/hexagonal-architecture-generator.py" "$@"
+else
+    python3 "$PROJECT_ROOT/libs/hexagonal-architecture-generator.py" "$TEMPLATES_DIR" "$@"
+fi
 
 echo ""
 echo "🎉 Generation complete! Check the generated projects in the project root"